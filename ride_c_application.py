@@ -117,6 +117,9 @@ class RideCApplication(RideC, ThreadedApplication):
         for pub in self.publishers:
             # XXX: pub format needs to be a tuple in order to be hashed into a dict
             pub = tuple(pub)
+            # skip any duplicate publisher entries rather than re-installing the same flow rules for them
+            if pub in routes_assigned:
+                continue
             self.register_host(pub)
             route = self._host_routes[pub]
             routes_assigned[pub] = route
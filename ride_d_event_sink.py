@@ -62,7 +62,8 @@ class RideDEventSink(ThreadedEventSink):
         """
         super(RideDEventSink, self).__init__(broker, topics_to_sink=topics_to_sink, subscriptions=subscriptions, **kwargs)
 
-        # Catalogue active subscribers' host addresses (indexed by topic with value being a set of subscribers)
+        # Catalogue active subscribers' host addresses (indexed by topic with value being a frozenset of subscribers).
+        # NOTE: these sets are replaced (copy-on-write) rather than modified so that readers don't need to lock them.
         self.subscribers = dict()
 
         self.dst_port = dst_port
@@ -81,14 +82,16 @@ class RideDEventSink(ThreadedEventSink):
         if self.use_multicast and addresses is None:
             raise NotImplementedError("you must specify the multicast 'addresses' parameter if multicast is enabled!")
 
-        # If we aren't doing multicast, we can create a single CoapClient without a specified src_port/address and this
-        # will be filled in for us...
+        # If we aren't doing multicast, we create a CoapClient (without a specified src_port, which will be filled in
+        # for us) for each subscriber when it first subscribes and keep re-using it.  We index them by
+        # (dst_ip_address, dst_port) so we needn't keep re-targeting a single client, which resets its CoAP state.
+        # WARNING: each CoapClient opens its own socket and receive thread, and this pool is unbounded (one per
+        # subscriber ever registered) until on_stop() closes them all.  That's fine for our experiments' few dozen
+        # subscribers, but a larger deployment should bound/evict it.
         # COAPTHON-SPECIFIC: unclear that we'd be able to do this in all future versions...
         if not self.use_multicast:
             self.rided = None
-            srv_ip = '10.0.0.1'
-            self._coap_clients = {'unicast': CoapClient(server_hostname=srv_ip, server_port=self.dst_port,
-                                                        confirmable_messages=not self.use_multicast)}
+            self._coap_clients = dict()
         # Configure RideD and necessary CoapClient instances...
         # Use a single client for EACH MDMT to connect with each server.  We do this so that we can specify the source
         # port and have the 'server' (remote subscribers) respond to this port# and therefore route responses along the
@@ -122,9 +125,20 @@ class RideDEventSink(ThreadedEventSink):
             # since they're updates: index them by    topic --> AlertContext
             self._outstanding_alerts = dict()
 
+            # Cache topology paths indexed by (src, dst) and hosts indexed by IP address since e.g. repeated
+            # subscriptions or alert responses would otherwise re-run the same topology lookups every time.
+            # NOTE: these are invalidated whenever we update the topology!
+            self._path_cache = dict()
+            self._host_cache = dict()
+
+            # Picks come from a small, stable set of publishers so we cache the hostnames parsed from their sources
+            self._publisher_hostnames = dict()
+
         # Use thread locks to prevent simultaneous write access to data structures due to e.g.
-        # handling multiple simultaneous subscription registrations.
+        # handling multiple simultaneous subscription registrations.  We use a separate lock for registering
+        # subscribers with RideD so that updating our own subscribers catalogue doesn't contend with it.
         self.__subscriber_lock = Lock()
+        self.__rided_lock = Lock()
 
     @property
     def coap_clients(self):
@@ -139,6 +153,36 @@ class RideDEventSink(ThreadedEventSink):
         # and topologies could be compared for differences (though that's probably about the same work as just refreshing the whole thing)
         # TODO: probably need to lock rided during this so we don't e.g. send_event to an MDMT that's currently being reconfigured.... maybe that's okay though?
         self.rided.update()
+        self._path_cache.clear()
+        self._host_cache.clear()
+
+    def __cached_get_host_by_ip(self, ip_address):
+        """
+        Returns the topology_manager's host for the given IP address, re-using the result of any previous lookup
+        until the next topology update.
+        :param ip_address:
+        :return: the host as returned by topology_manager.get_host_by_ip()
+        """
+        host = self._host_cache.get(ip_address)
+        if host is None:
+            host = self.rided.topology_manager.get_host_by_ip(ip_address)
+            self._host_cache[ip_address] = host
+        return host
+
+    def __cached_get_path(self, src, dst):
+        """
+        Returns the topology_manager's path from src to dst, re-using the result of any previous lookup until the
+        next topology update.
+        :param src:
+        :param dst:
+        :return: the path as returned by topology_manager.get_path()
+        """
+        key = (src, dst)
+        path = self._path_cache.get(key)
+        if path is None:
+            path = self.rided.topology_manager.get_path(src, dst)
+            self._path_cache[key] = path
+        return path
 
     def on_start(self):
         """
@@ -191,8 +235,7 @@ class RideDEventSink(ThreadedEventSink):
         :return:
         """
 
-        # TODO: don't hardcode this...
-        path = "/events/%s" % topic
+        path = EVENTS_API_PATH + topic
 
         if response_callback is None:
             response_callback = self.__put_event_callback
@@ -230,7 +273,7 @@ class RideDEventSink(ThreadedEventSink):
 
             if alert_context and mdmt_used:  # multicast alert!
                 # notify RideD about this successful response
-                responder = self.rided.topology_manager.get_host_by_ip(responder_ip_addr)
+                responder = self.__cached_get_host_by_ip(responder_ip_addr)
                 self.rided.notify_alert_response(responder, alert_context, mdmt_used)
 
         elif response.code == CoapCodes.NOT_FOUND.number:
@@ -250,10 +293,8 @@ class RideDEventSink(ThreadedEventSink):
         # Send the event as we're configured to
         try:
             # Determine the best MDMT, get the destination associated with it, and send the event.
+            # NOTE: self.rided is always set up by on_start() when we're using multicast
             if self.use_multicast:
-                # if we ever encounter this, replace it with some real error handling...
-                assert self.rided is not None, "woops!  Ride-D should be set up but it isn't..."
-
                 try:
                     # XXX: we can only have a single outstanding alert at a time for a given topic so
                     # we need to cancel the last one if it exists.
@@ -267,12 +308,10 @@ class RideDEventSink(ThreadedEventSink):
 
             # Configured as unicast, so send a message to each subscriber individually
             else:
-                # For unicast case, we only needed to create one client!
-                coap_client = self.coap_clients[0]
-
-                for dst_ip_address in self.subscribers.get(topic, []):
-                    # But, we do need to set the destination address for that client...
-                    coap_client.server = (dst_ip_address, self.dst_port)
+                # NOTE: no lock needed as this subscribers snapshot is never modified, only replaced, and each
+                # subscriber's client was already created when it subscribed
+                for dst_ip_address in self.subscribers.get(topic, ()):
+                    coap_client = self._coap_clients[(dst_ip_address, self.dst_port)]
                     self.__send_alert_from_client(encoded_event, topic=topic, coap_client=coap_client)
 
             return True
@@ -297,10 +336,12 @@ class RideDEventSink(ThreadedEventSink):
 
             if self.rided and not event.is_local:
                 # Find the publishing host's IP address and use that to notify RideD
-                publisher = event.source
                 # ENHANCE: accept full address (e.g. ipv4_add, port) as publisher IDs just like RideC!
-                publisher = get_hostname_from_path(publisher)
-                assert publisher is not None, "error processing publication with no source hostname: %s" % event.source
+                publisher = self._publisher_hostnames.get(event.source)
+                if publisher is None:
+                    publisher = get_hostname_from_path(event.source)
+                    assert publisher is not None, "error processing publication with no source hostname: %s" % event.source
+                    self._publisher_hostnames[event.source] = publisher
                 # TODO: may need to wrap this with mutex
                 self.rided.notify_publication(publisher, id_type='ip')
 
@@ -309,7 +350,7 @@ class RideDEventSink(ThreadedEventSink):
             if self.rided:
                 for host, route in event.data.items():
                     log.debug("setting publisher route from event: host(%s) --> %s" % (host, route))
-                    host = self.rided.topology_manager.get_host_by_ip(host)
+                    host = self.__cached_get_host_by_ip(host)
                     self.rided.set_publisher_route(host, route)
 
         else:
@@ -327,17 +368,25 @@ class RideDEventSink(ThreadedEventSink):
 
         log.debug("processing RIDE-D subscription for topic '%s' by host '%s'" % (topic, host))
         with self.__subscriber_lock:
-            self.subscribers.setdefault(topic, set()).add(host)
+            # Copy-on-write: readers keep iterating over whatever snapshot they grabbed.  Re-subscriptions (e.g. retries)
+            # don't need a new snapshot at all.
+            subscribers = self.subscribers.get(topic, frozenset())
+            if host not in subscribers:
+                # Add the unicast client first so that any sender seeing this subscriber can find it
+                if not self.use_multicast and (host, self.dst_port) not in self._coap_clients:
+                    self._coap_clients[(host, self.dst_port)] = CoapClient(server_hostname=host, server_port=self.dst_port,
+                                                                           confirmable_messages=not self.use_multicast)
+                self.subscribers[topic] = subscribers | frozenset((host,))
 
         if self.rided:
             # WARNING: supposedly we should only register subscribers that are reachable in our topology view or
             #  we'll cause errors later... we should try to handle those errors instead!
             try:
                 # ENHANCE: handle port numbers? all ports will be same for our scenario and OF could convert them anyway so no hurry...
-                host = self.rided.topology_manager.get_host_by_ip(host)
+                host = self.__cached_get_host_by_ip(host)
                 # If we can't find a path, how did we even get this subscription?  Path failed after it was sent?
-                self.rided.topology_manager.get_path(host, self.rided.dpid)
-                with self.__subscriber_lock:
+                self.__cached_get_path(host, self.rided.dpid)
+                with self.__rided_lock:
                     self.rided.add_subscriber(host, topic_id=SEISMIC_ALERT_TOPIC)
             except BaseException as e:
                 log.warning("Route between subscriber %s and server %s not found: skipping...\nError: %s" % (host, self.rided.dpid, e))
@@ -6,6 +6,8 @@ PUBLISHER_ROUTE_TOPIC = 'publisher_route'
 
 # add topic to end of path
 SUBSCRIPTION_API_PATH = '/subscriptions/'
+EVENTS_API_PATH = '/events/'
+SEISMIC_ALERT_PATH = EVENTS_API_PATH + SEISMIC_ALERT_TOPIC
 
 from scale_client.util.uri import parse_uri
 from scale_client.networks.util import msg_fits_one_coap_packet, COAP_MAX_PAYLOAD_SIZE
@@ -101,8 +103,13 @@ def compress_alert_one_coap_packet(event):
             "trimmed too many events! down to %d/%d but longest_eid is %d!\nEncoded Event: " \
             "%s" % (len(comp_ev), COAP_MAX_PAYLOAD_SIZE, _longest_eid, comp_ev)
 
+    # Each event ID we remove shrinks the encoding by its length plus its quotes and comma, so rather than
+    # re-serializing after every single removal we drop just enough of the oldest ones to cover the overage.
     while not msg_fits_one_coap_packet(comp_ev):
-        event.data.pop()
+        _bytes_over = len(comp_ev) - COAP_MAX_PAYLOAD_SIZE
+        _bytes_trimmed = len(event.data.pop()) + 3
+        while event.data and _bytes_trimmed < _bytes_over:
+            _bytes_trimmed += len(event.data.pop()) + 3
         comp_ev = event.to_json(exclude_fields=excluded_fields, no_whitespace=True)
 
     # Verify we didn't cut out any new events!
@@ -2,7 +2,7 @@
 # (c) Kyle Benson 2017
 import json
 import time
-from Queue import Queue
+from Queue import Queue, Empty
 
 from scale_client.networks.coap_server import CoapServer
 from scale_client.sensors.virtual_sensor import VirtualSensor
@@ -35,6 +35,9 @@ class SeismicAlertServer(VirtualSensor):
 
         # Stores received events indexed by their 'id'
         self.events_rcvd = dict()
+        # The aggregated form of events_rcvd that goes in each alert: we add new arrivals to it as they're processed
+        # rather than rebuilding the whole thing every 'sample_interval'
+        self._agg_events = dict()
 
         # Need to know when a CoapServer is running so we can open an endpoint for receiving seismic events.
         ev = CoapServer.CoapServerRunning(None)
@@ -52,14 +55,13 @@ class SeismicAlertServer(VirtualSensor):
         # TODO: store server name and check we get the right one?
         # ENHANCE: maybe this is a common pattern for scale modules that use coap resources?  really it's a remote_coap_subscribe(topic, cb=None)???  maybe this belongs in a RemotePubSubManager class to handle all these things...
         event = self.make_event(event_type=SEISMIC_PICK_TOPIC, data=None)
-        # TODO: not hard-code this
-        path = '/events/%s' % SEISMIC_PICK_TOPIC
+        path = EVENTS_API_PATH + SEISMIC_PICK_TOPIC
         # NOTE: no one remote should POST/DEL only PUT
         server.store_event(event, path, disable_post=True, disable_delete=True)
 
         # do the same for generic iot data
         event = self.make_event(event_type=IOT_GENERIC_TOPIC, data=None)
-        path = '/events/%s' % IOT_GENERIC_TOPIC
+        path = EVENTS_API_PATH + IOT_GENERIC_TOPIC
         server.store_event(event, path, disable_post=True, disable_delete=True)
 
     def read_raw(self):
@@ -81,9 +83,15 @@ class SeismicAlertServer(VirtualSensor):
         new_events = False
 
         alert_time = time.time()
-        while not self.events_to_process.empty():
-            ev = self.events_to_process.get()
-            log.debug("processing event %s" % ev)
+        # Drain everything that's arrived so far; get_nowait() avoids taking the queue's lock a second time per event
+        # just to check empty() first.
+        while True:
+            try:
+                ev = self.events_to_process.get_nowait()
+            except Empty:
+                break
+            # NOTE: let logging format this only if enabled as stringifying every event adds up during an earthquake
+            log.debug("processing event %s", ev)
             ev_id = get_event_id(ev)
             # Skip over any null-payload events entirely, store all others for outputting to file, and otherwise only
             # keep events with new IDs not seen before for the aggregation mechanism.
@@ -94,16 +102,15 @@ class SeismicAlertServer(VirtualSensor):
                     # store the time we FIRST packed this event into an alert
                     ev.metadata['alert_time'] = alert_time
                     self.events_rcvd[ev_id] = ev
+                    self._agg_events[ev_id] = dict(time_sent=ev.timestamp, time_aggd=ev.metadata['time_aggd'])
                 self.__output_events.append(ev)
 
         if not new_events:
             return None
 
-        # Then aggregate them and return the result for publication
-        # ENHANCE: cache this and add new arrivals to it for better efficiency?
-        agg_events = {ev_id: dict(time_sent=ev.timestamp, time_aggd=ev.metadata['time_aggd']) for ev_id, ev in self.events_rcvd.items()}
-
-        return agg_events
+        # Then return the aggregate for publication: we hand out a copy since previous alerts may still be in use
+        # (e.g. being encoded for sending) while we add new arrivals to it
+        return dict(self._agg_events)
 
     def on_event(self, event, topic):
         """Store this event for later aggregation"""
@@ -48,7 +48,10 @@ class SeismicAlertSubscriber(ThreadedApplication):
         ev = CoapServer.CoapServerRunning(None)
         self.subscribe(ev, callback=self.__class__.__on_coap_ready)
 
-        self.client = None
+        # CoapClients with an in-flight subscription request, indexed by remote broker since we subscribe with each
+        # of them concurrently; on_stop() closes any that remain.
+        # NOTE: whoever removes a client from here (remote_subscribe() or on_stop()) is the one that closes it.
+        self._clients = dict()
 
     def on_event(self, event, topic):
         """
@@ -58,18 +61,20 @@ class SeismicAlertSubscriber(ThreadedApplication):
         """
 
         # TODO: determine if this is thread-safe or if we need a Queue here too...
+        # NOTE: we only subscribe to SEISMIC_ALERT_TOPIC so the broker already filtered out any other topics
 
-        if topic is None:
-            topic = event.topic
-        assert topic == SEISMIC_ALERT_TOPIC
+        log.debug("processing alert: %s", event.data)
 
-        log.debug("processing alert: %s" % event.data)
+        # All the picks in this alert arrived together so they share the same receive time
+        time_rcvd = time.time()
 
         try:
+            # NOTE: keep the 'in' check + subscript here: most IDs are duplicates once an earthquake is underway and
+            # this is faster for them than a dict.get() method call
             for ev_id in event.data:
                 if ev_id not in self.events_rcvd:
                     ev = dict()
-                    ev['time_rcvd'] = time.time()
+                    ev['time_rcvd'] = time_rcvd
                     ev['copies_rcvd'] = 1
                     ev['agg_src'] = event.source
                     ev['alert_time'] = event.timestamp
@@ -85,11 +90,14 @@ class SeismicAlertSubscriber(ThreadedApplication):
         that will analyze the resulting performance."""
         super(SeismicAlertSubscriber, self).on_stop()
 
-        if self.client is not None:
-            self.client.close()
+        for remote_broker in list(self._clients.keys()):
+            client = self._clients.pop(remote_broker, None)
+            if client is not None:
+                client.close()
 
+        # stream the encoding straight to the file rather than building the whole (potentially large) string first
         with open(self.output_file, "w") as f:
-            f.write(json.dumps(self.events_rcvd, indent=2))
+            json.dump(self.events_rcvd, f, indent=2)
 
     def __on_coap_ready(self, server):
         """
@@ -101,8 +109,7 @@ class SeismicAlertSubscriber(ThreadedApplication):
         # ENHANCE: store server name and check we get the right one?
         # ENHANCE: maybe this is a common pattern for scale modules that use coap resources?  really it's a remote_coap_subscribe(topic, cb=None)???  maybe this belongs in a RemotePubSubManager class to handle all these things...
         event = self.make_event(event_type=SEISMIC_ALERT_TOPIC, data=None)
-        # ENHANCE: not hard-code this
-        path = '/events/%s' % SEISMIC_ALERT_TOPIC
+        path = SEISMIC_ALERT_PATH
         # NOTE: no one remote should POST only PUT; delete could recall/cancel an alert but we don't handle that...
         server.store_event(event, path, disable_post=True, disable_delete=True)
 
@@ -112,10 +119,11 @@ class SeismicAlertSubscriber(ThreadedApplication):
             self.run_in_background(self.remote_subscribe, SEISMIC_ALERT_TOPIC, remote_broker)
 
     # ENHANCE: not hard-code subscriptions path
-    def remote_subscribe(self, topic, remote_broker, path=SUBSCRIPTION_API_PATH, tries_remaining=3):
+    def remote_subscribe(self, topic, remote_broker, path=SUBSCRIPTION_API_PATH, tries_remaining=3, retry_interval=10):
         """
         Register subscription with remote_broker by sending a CoAP request to the specified path.
         :param path: string representing path part of subscription API URL; it should include a '%s' to be filled in with the topic
+        :param retry_interval: seconds to wait before re-trying a subscription request the server rejected
         """
         # ENHANCE: could use DEL to unsubscribe?
 
@@ -125,22 +133,29 @@ class SeismicAlertSubscriber(ThreadedApplication):
         except TypeError:
             pass
 
-        self.client = CoapClient(server_hostname=remote_broker)
-        response = self.client.post(path=path, payload=topic)
-        if not coap_response_success(response):
-            if response.code == CoapCodes.METHOD_NOT_ALLOWED:
-                # XXX: for our experiments, try again as the server likely just didn't open the subscription API yet
-                time_between_subscription_attempts = 10
+        # XXX: for our experiments, we re-try if the server likely just didn't open the subscription API yet.  We do
+        # this in a loop (rather than recursing) so that each attempt's client gets closed before we sleep.
+        while True:
+            # NOTE: keep this client local as the other remote brokers' subscription threads run concurrently
+            client = CoapClient(server_hostname=remote_broker)
+            self._clients[remote_broker] = client
+            try:
+                response = client.post(path=path, payload=topic)
+            finally:
+                # on_stop() may have already taken (and closed) this client
+                if self._clients.pop(remote_broker, None) is client:
+                    client.close()
+
+            if coap_response_success(response):
+                log.debug("successfully subscribed to topic %s via remote_broker %s" % (topic, remote_broker))
+            elif response.code == CoapCodes.METHOD_NOT_ALLOWED.number:
                 if tries_remaining > 0:
-                    log.debug("server responded to subscription request with METHOD_NOT_ALLOWED: retrying in %d seconds..." % time_between_subscription_attempts)
-                    time.sleep(time_between_subscription_attempts)
-                    self.remote_subscribe(SEISMIC_ALERT_TOPIC, remote_broker, path=path, tries_remaining=tries_remaining-1)
+                    log.debug("server responded to subscription request with METHOD_NOT_ALLOWED: retrying in %d seconds..." % retry_interval)
+                    tries_remaining -= 1
+                    time.sleep(retry_interval)
+                    continue
                 else:
                     log.warning("GIVING UP on remote_subscription after multiple attempts that all returned METHOD_NOT_ALLOWED!")
             else:
                 log.error("failed to send subscription request due to Coap error: %s" % coap_code_to_name(response.code))
-        else:
-            log.debug("successfully subscribed to topic %s via remote_broker %s" % (topic, remote_broker))
-
-        self.client.close()
-        self.client = None
+            return
@@ -2,10 +2,13 @@ import unittest
 import logging
 # logging.basicConfig(level=logging.DEBUG)
 import time
+import threading
 
 from scale_client.core.broker import Broker
 from scale_client.core.sensed_event import SensedEvent
+from scale_client.networks.util import CoapCodes
 from seismic_alert_server import SeismicAlertServer
+import seismic_alert_subscriber
 from seismic_alert_subscriber import SeismicAlertSubscriber
 from seismic_alert_common import *
 
@@ -105,6 +108,7 @@ class TestSeismicWarning(unittest.TestCase):
 
         # Because we only publish the event after receiving new events to aggregate, we use this flag to check that.
         once_through = False
+        first_agg = None
 
         # Now feed them to the server in order and get the aggregate a couple times along the way to verify
         # that aggregation is working properly, including the subscriber's duplicate counts.
@@ -122,10 +126,25 @@ class TestSeismicWarning(unittest.TestCase):
                     self.assertEqual(stats['copies_rcvd'], i+1)
                 self.assertEqual(len(self.sub.events_rcvd), n_sources)
 
+                first_agg = agg
                 once_through = True
             else:
                 self.assertIsNone(agg.data, "aggd event data should be null after first round through since all remaining rounds are duplciates!")
 
+        # Now verify the subscriber with the actual wire format: a compressed alert whose data is a list of event IDs.
+        # It re-sends all the IDs seen so far and adds a new one twice, which should count as two copies.
+        alert = SensedEvent.from_json(compress_alert_one_coap_packet(first_agg))
+        self.assertIsInstance(alert.data, list)
+        seen_ids = list(self.sub.events_rcvd.keys())
+        self.assertEqual(sorted(alert.data), sorted(seen_ids))
+        new_id = 'new_sensor/0'
+        alert.data.extend([new_id, new_id])
+
+        self.sub.on_event(alert, alert.topic)
+        expected_copies = {ev_id: 2 for ev_id in seen_ids}
+        expected_copies[new_id] = 2
+        self.assertEqual({ev_id: stats['copies_rcvd'] for ev_id, stats in self.sub.events_rcvd.items()}, expected_copies)
+
     def test_timestamps(self):
         """Verify that the timestamps of when the original picks were created get carried through;
         also ensure that the alert's time is the time it was aggregated.  Also check that the subscriber
@@ -303,6 +322,60 @@ class TestSeismicWarning(unittest.TestCase):
         # logging.basicConfig(level=logging.DEBUG)
         # self.test_alert_compression(n_sensors=100)
 
+    def test_remote_subscribe_retry(self):
+        """Verify that concurrently subscribing with multiple remote brokers, which each first respond with
+        METHOD_NOT_ALLOWED and then succeed, retries each of them, raises no errors, and closes every CoapClient used
+        exactly once."""
+
+        clients = []
+        n_posts = dict()
+
+        class FakeResponse(object):
+            def __init__(self, code):
+                # NOTE: real responses carry the integer code, not the CoapCodes code object
+                self.code = code
+
+        class FakeCoapClient(object):
+            def __init__(self, server_hostname, **kwargs):
+                self.server_hostname = server_hostname
+                self.n_closes = 0
+                clients.append(self)
+
+            def post(self, path, payload):
+                n_posts[self.server_hostname] = n_posts.get(self.server_hostname, 0) + 1
+                # first attempt is rejected as if the server's subscription API isn't open yet
+                if n_posts[self.server_hostname] == 1:
+                    return FakeResponse(CoapCodes.METHOD_NOT_ALLOWED.number)
+                return FakeResponse(CoapCodes.CHANGED.number)
+
+            def close(self):
+                self.n_closes += 1
+
+        errors = []
+        def _subscribe(remote_broker):
+            try:
+                self.sub.remote_subscribe(SEISMIC_ALERT_TOPIC, remote_broker, retry_interval=0)
+            except BaseException as e:
+                errors.append(e)
+
+        real_client = seismic_alert_subscriber.CoapClient
+        seismic_alert_subscriber.CoapClient = FakeCoapClient
+        try:
+            remote_brokers = ['broker%d' % i for i in range(3)]
+            threads = [threading.Thread(target=_subscribe, args=(b,)) for b in remote_brokers]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            seismic_alert_subscriber.CoapClient = real_client
+
+        self.assertEqual(errors, [])
+        self.assertEqual(n_posts, {b: 2 for b in remote_brokers})
+        self.assertEqual(len(clients), 2 * len(remote_brokers))
+        self.assertTrue(all(c.n_closes == 1 for c in clients), "each CoapClient should have been closed exactly once!")
+        self.assertFalse(self.sub._clients, "no CoapClients should remain in-flight!")
+
     # Helper functions used across multiple tests
 
     def _generate_events(self, n_unique_events, n_sources, n_duplicates=1,